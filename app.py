@@ -1,12 +1,24 @@
 import os
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+import time
+from functools import wraps
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, g, session, has_request_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
 from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
     pass
 
-db = SQLAlchemy(model_class=Base)
+class RoutingSession(Session):
+    """Session that sends reads from read-only routes to the replica bind"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and use_replica():
+            return self._db.engines['replica']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+db = SQLAlchemy(model_class=Base, session_options={"class_": RoutingSession})
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key")
@@ -17,8 +29,39 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     "pool_recycle": 300,
     "pool_pre_ping": True,
 }
+
+# Optional read replica for reports and dashboard queries
+if os.environ.get("DATABASE_REPLICA_URL"):
+    app.config["SQLALCHEMY_BINDS"] = {"replica": os.environ["DATABASE_REPLICA_URL"]}
+
+# Seconds a browser keeps reading from the primary after it writes,
+# so replication lag never hides a stock update the user just made
+app.config["REPLICA_STICKY_SECONDS"] = int(os.environ.get("REPLICA_STICKY_SECONDS", 10))
 db.init_app(app)
 
+def read_replica(view):
+    """Mark a read-only view so its queries may be served by the replica"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.read_replica = True
+        return view(*args, **kwargs)
+    return wrapper
+
+def use_replica():
+    """Whether queries in the current request should go to the replica"""
+    if not has_request_context() or not g.get('read_replica'):
+        return False
+    if 'replica' not in app.config.get("SQLALCHEMY_BINDS", {}):
+        return False
+    # Read-your-writes: stay on the primary for a while after a write
+    return session.get('primary_until', 0) < time.time()
+
+@event.listens_for(RoutingSession, 'after_flush')
+def mark_primary_sticky(db_session, flush_context):
+    """Pin this browser to the primary once it has written something"""
+    if has_request_context() and 'replica' in app.config.get("SQLALCHEMY_BINDS", {}):
+        session['primary_until'] = time.time() + app.config["REPLICA_STICKY_SECONDS"]
+
 @app.route('/')
 def index():
     return render_template('index.html')
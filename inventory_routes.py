@@ -1,5 +1,5 @@
 from flask import render_template, request, redirect, url_for, flash, jsonify
-from app import app, db
+from app import app, db, read_replica
 from models import Product, Category, StockMovement, Supplier
 from datetime import datetime
 import logging
@@ -9,6 +9,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 @app.route('/admin')
+@read_replica
 def admin_dashboard():
     """Admin dashboard with inventory overview"""
     try:
@@ -251,6 +252,7 @@ def admin_add_category():
         return redirect(url_for('admin_categories'))
 
 @app.route('/admin/reports')
+@read_replica
 def admin_reports():
     """Inventory reports page"""
     try: